@@ -0,0 +1,128 @@
+"""
+Performance benchmarks for the game application.
+
+Each benchmark returns its measurements as a dictionary and has a matching
+budget. The test suite asserts the budgets, and the module can also be run
+directly to print the numbers::
+
+    python -m game.benchmarks
+
+Budgets may be overridden through environment variables so slower CI hosts
+can be accommodated without editing code. Being wall-clock measurements,
+the budget tests only run in the test suite when ``RUN_BENCHMARKS=1``;
+``python -m game.benchmarks`` always enforces them.
+"""
+from __future__ import annotations
+
+import json
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from itertools import accumulate
+from pathlib import Path
+from typing import Dict
+
+from .timeline import GAME_LENGTH_MS, SPAWN_INTERVAL_MS, encode_timeline, verify_timeline
+
+PROJECT_DIR = Path(__file__).resolve().parent.parent
+
+# Seconds allowed for importing the WSGI module (Django setup plus warmup)
+# and for serving the first request on the freshly imported application.
+IMPORT_BUDGET = float(os.getenv('STARTUP_IMPORT_BUDGET', '3.0'))
+FIRST_REQUEST_BUDGET = float(os.getenv('STARTUP_FIRST_REQUEST_BUDGET', '0.5'))
+# Minimum number of full-round timelines verified per second.
+VERIFY_THROUGHPUT_BUDGET = float(os.getenv('VERIFY_THROUGHPUT_BUDGET', '5000'))
+# Opt in to the wall-clock budget tests in ``manage.py test``.
+RUN_BENCHMARKS = os.getenv('RUN_BENCHMARKS') == '1'
+
+# Executed in a fresh interpreter so module caches from the caller do not
+# hide the real cold-start cost. The first request is served by calling the
+# imported WSGI ``application`` directly; the request environ is built before
+# the timer starts.
+_STARTUP_PROBE = """
+import json, time
+start = time.perf_counter()
+from mini_game_project.wsgi import application
+imported = time.perf_counter()
+from django.test import RequestFactory
+environ = RequestFactory().get('/').environ
+statuses = []
+ready = time.perf_counter()
+b''.join(application(environ, lambda status, headers, exc_info=None: statuses.append(status)))
+served = time.perf_counter()
+assert statuses[0].startswith('200'), statuses
+print(json.dumps({'import': imported - start, 'first_request': served - ready}))
+"""
+
+
+def measure_startup() -> Dict[str, float]:
+    """Measure cold import and first-request latency of the WSGI application.
+
+    :returns: Seconds spent in ``import`` and in the ``first_request``.
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        env = dict(os.environ)
+        env['DJANGO_SETTINGS_MODULE'] = 'mini_game_project.settings'
+        env['DJANGO_ALLOWED_HOSTS'] = 'testserver'
+        # Warm up against a migrated throwaway database, never the real one
+        env['DJANGO_DB_PATH'] = str(Path(tmp) / 'startup.sqlite3')
+        subprocess.run(
+            [sys.executable, 'manage.py', 'migrate', '--no-input', '--verbosity', '0'],
+            cwd=PROJECT_DIR,
+            env=env,
+            check=True,
+            capture_output=True,
+        )
+        output = subprocess.run(
+            [sys.executable, '-c', _STARTUP_PROBE],
+            cwd=PROJECT_DIR,
+            env=env,
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def sample_timeline(seed: int = 0) -> str:
+    """Build a realistic full-round timeline: 59 spawns, most of them hit."""
+    rng = random.Random(seed)
+    spawn_deltas = [SPAWN_INTERVAL_MS + rng.randint(0, 5) for _ in range(59)]
+    spawn_times = list(accumulate(spawn_deltas))
+    hits = []
+    for index, spawned in enumerate(spawn_times):
+        reaction = rng.randint(180, 450)
+        if rng.random() < 0.85 and spawned + reaction <= GAME_LENGTH_MS:
+            hits.append((index, reaction))
+    return encode_timeline(spawn_deltas, hits)
+
+
+def measure_verification_throughput(rounds: int = 5000) -> float:
+    """Measure how many timelines ``verify_timeline`` checks per second."""
+    timelines = [sample_timeline(seed) for seed in range(100)]
+    start = time.perf_counter()
+    for i in range(rounds):
+        verify_timeline(timelines[i % len(timelines)])
+    return rounds / (time.perf_counter() - start)
+
+
+def main() -> int:
+    """Print every benchmark and return a non-zero status on a budget overrun."""
+    startup = measure_startup()
+    print(f"import: {startup['import']:.3f}s (budget {IMPORT_BUDGET:.3f}s)")
+    print(f"first request: {startup['first_request']:.3f}s (budget {FIRST_REQUEST_BUDGET:.3f}s)")
+    throughput = measure_verification_throughput()
+    print(f"timeline verification: {throughput:,.0f}/s (budget {VERIFY_THROUGHPUT_BUDGET:,.0f}/s)")
+    over_budget = (
+        startup['import'] > IMPORT_BUDGET
+        or startup['first_request'] > FIRST_REQUEST_BUDGET
+        or throughput < VERIFY_THROUGHPUT_BUDGET
+    )
+    return 1 if over_budget else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
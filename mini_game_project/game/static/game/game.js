@@ -15,10 +15,20 @@
         let hits = 0;
         let combos = 0;
         let lastHitTime = null;
+        let finished = false;
         const gameDuration = 30.0; // seconds
         const spawnInterval = 500; // milliseconds between spawns
         let startTime = performance.now();
 
+        // Timeline verified by the server: spawn times and
+        // [targetIndex, reactionMs] hit pairs, in whole milliseconds
+        const spawnTimes = [];
+        const hitPairs = [];
+
+        function elapsedMs() {
+            return Math.round(performance.now() - startTime);
+        }
+
         // Spawn a target at a random position within the game area
         function spawnTarget() {
             const target = document.createElement('div');
@@ -31,6 +41,8 @@
             target.style.height = `${size}px`;
             target.style.left = `${x}px`;
             target.style.top = `${y}px`;
+            target.dataset.index = spawnTimes.length.toString();
+            spawnTimes.push(elapsedMs());
             target.addEventListener('click', handleHit);
             gameArea.appendChild(target);
             // Remove after 1 second
@@ -42,6 +54,14 @@
         }
 
         function handleHit(event) {
+            // Clicks after the round ends (before the next animation frame
+            // calls finishGame) do not count
+            const hitMs = elapsedMs();
+            if (finished || hitMs >= gameDuration * 1000) {
+                return;
+            }
+            const index = Number(event.target.dataset.index);
+            hitPairs.push(index, hitMs - spawnTimes[index]);
             hits += 1;
             const now = performance.now();
             if (lastHitTime && now - lastHitTime <= 800) {
@@ -76,12 +96,34 @@
             }
         }, spawnInterval);
 
+        // Pack the timeline into a delta-encoded Uint16Array, base64 encoded:
+        // [spawnCount, spawnDeltas..., targetIndex, reactionMs, ...]
+        function encodeTimeline() {
+            const values = new Uint16Array(1 + spawnTimes.length + hitPairs.length);
+            values[0] = spawnTimes.length;
+            let previous = 0;
+            spawnTimes.forEach((time, i) => {
+                values[1 + i] = time - previous;
+                previous = time;
+            });
+            values.set(hitPairs, 1 + spawnTimes.length);
+            // Uint16Array uses the platform byte order; DataView forces little-endian
+            const bytes = new Uint8Array(values.length * 2);
+            const view = new DataView(bytes.buffer);
+            values.forEach((value, i) => view.setUint16(i * 2, value, true));
+            let binary = '';
+            bytes.forEach((byte) => {
+                binary += String.fromCharCode(byte);
+            });
+            return btoa(binary);
+        }
+
         function finishGame() {
-            // Send results to server
+            finished = true;
+            // Send the timeline to the server, which derives hits, combos and
+            // the duration itself
             const payload = {
-                hits: hits,
-                combos: combos,
-                duration: (performance.now() - startTime) / 1000.0,
+                timeline: encodeTimeline(),
             };
             fetch(`/finish/${sessionId}/`, {
                 method: 'POST',
@@ -91,7 +133,12 @@
                 },
                 body: JSON.stringify(payload),
             })
-                .then((response) => response.json())
+                .then((response) => {
+                    if (!response.ok) {
+                        throw new Error(`Finish failed with status ${response.status}`);
+                    }
+                    return response.json();
+                })
                 .then((data) => {
                     // Redirect to results page
                     window.location.href = data.redirect_url;
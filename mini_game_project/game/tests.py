@@ -6,12 +6,29 @@ core view flows. They can be run with ``python manage.py test`` to
 verify that the application logic is correct.
 """
 import json
-from django.test import TestCase, Client
+import tempfile
+from pathlib import Path
+from unittest import skipUnless
+
+from django.contrib.staticfiles.storage import staticfiles_storage
+from django.core.management import call_command
+from django.test import TestCase, Client, override_settings
 from django.urls import reverse
 from django.utils import timezone
 
+from . import benchmarks
 from .models import Player, GameSession
+from .timeline import TimelineError, encode_timeline, verify_timeline
 from .utils import compute_score
+from .warmup import warm_templates, warm_urls
+
+# Targets spawn every 500 ms; each hit is (target index, reaction ms). The
+# hits on targets 1, 5 and 9 follow the previous hit within 800 ms.
+SAMPLE_HITS = [
+    (0, 300), (1, 250), (4, 320), (5, 280), (8, 310),
+    (9, 350), (12, 290), (14, 330), (16, 270), (18, 300),
+]
+SAMPLE_TIMELINE = encode_timeline([500] * 20, SAMPLE_HITS)
 
 
 class ModelTestCase(TestCase):
@@ -26,6 +43,53 @@ class ModelTestCase(TestCase):
         self.assertEqual(compute_score(10, 5, 20), 10 * 10 + 5 * 5 + 20)
 
 
+class TimelineTestCase(TestCase):
+    """Tests for server-side timeline verification."""
+
+    def test_derives_hits_and_combos(self) -> None:
+        verified = verify_timeline(SAMPLE_TIMELINE)
+        self.assertEqual((verified.hits, verified.combos), (10, 3))
+        self.assertEqual(verified.last_event_ms, 10000)
+
+    def test_rejects_malformed_timeline(self) -> None:
+        for encoded in ('', 'not base64!', 'é', 'AAE=', encode_timeline([500], [(0, 300), (1, 300)])):
+            with self.assertRaises(TimelineError):
+                verify_timeline(encoded)
+
+    def test_rejects_implausible_timeline(self) -> None:
+        cases = [
+            encode_timeline([500] * 3, [(0, 300), (0, 300)]),  # same target twice
+            encode_timeline([500, 100, 100], []),  # spawns too fast
+            encode_timeline([100] + [500] * 3, []),  # first spawn too early
+            encode_timeline([250] * 60, []),  # twice the client cadence
+            encode_timeline([500] * 10, [(i, 200) for i in range(10)]),  # constant reaction
+            encode_timeline([500] * 3, [(1, 300), (0, 300)]),  # out of order
+        ]
+        for encoded in cases:
+            with self.assertRaises(TimelineError):
+                verify_timeline(encoded)
+
+    def test_rejects_forged_double_cadence_round(self) -> None:
+        # 119 spawns 250 ms apart, all hit with jittered reactions: would score
+        # 1750 against 880 for an honest perfect round
+        forged = encode_timeline([250] * 119, [(i, 200 + (i * 37) % 150) for i in range(119)])
+        with self.assertRaises(TimelineError):
+            verify_timeline(forged)
+
+    def test_drops_implausible_hits(self) -> None:
+        # a lucky click 50 ms after a spawn scores nothing
+        verified = verify_timeline(encode_timeline([500] * 3, [(0, 300), (1, 50), (2, 320)]))
+        self.assertEqual((verified.hits, verified.combos, verified.dropped), (2, 0, 1))
+        # a click landing after the 30 s round scores nothing
+        verified = verify_timeline(encode_timeline([500] * 59, [(57, 300), (58, 600)]))
+        self.assertEqual((verified.hits, verified.dropped), (1, 1))
+
+    @skipUnless(benchmarks.RUN_BENCHMARKS, 'set RUN_BENCHMARKS=1 to run wall-clock budgets')
+    def test_verification_throughput_within_budget(self) -> None:
+        throughput = benchmarks.measure_verification_throughput()
+        self.assertGreaterEqual(throughput, benchmarks.VERIFY_THROUGHPUT_BUDGET)
+
+
 class ViewTestCase(TestCase):
     """Tests for view logic and full game loop."""
 
@@ -41,8 +105,11 @@ class ViewTestCase(TestCase):
         self.assertEqual(response.status_code, 302)
         # Extract session id from last created GameSession
         session = GameSession.objects.latest('id')
-        # Finish the game with JSON payload
-        payload = {'hits': 10, 'combos': 3, 'duration': 25}
+        # The server measures elapsed time itself: pretend the round began 24.5s ago
+        session.started_at = timezone.now() - timezone.timedelta(seconds=24.5)
+        session.save()
+        # Finish the game with a timeline of 10 hits, 3 of them combos
+        payload = {'timeline': SAMPLE_TIMELINE}
         finish_url = reverse('game:finish', args=[session.id])
         response = self.client.post(
             finish_url,
@@ -53,9 +120,75 @@ class ViewTestCase(TestCase):
         session.refresh_from_db()
         # Verify that session has ended and score computed correctly
         self.assertIsNotNone(session.ended_at)
-        expected = compute_score(10, 3, 5.0)  # 30-second game, 25s elapsed => 5s left
+        expected = compute_score(10, 3, 5.0)  # 30-second game, ~24.5s elapsed => 5 whole seconds left
         self.assertEqual(session.score, expected)
 
+    def test_finish_ignores_client_totals(self) -> None:
+        started_at = timezone.now() - timezone.timedelta(seconds=30)
+        session = GameSession.objects.create(player=self.player, started_at=started_at)
+        payload = {'hits': 500, 'combos': 500, 'duration': 30, 'timeline': SAMPLE_TIMELINE}
+        response = self.client.post(
+            reverse('game:finish', args=[session.id]),
+            data=json.dumps(payload),
+            content_type='application/json',
+        )
+        self.assertEqual(response.status_code, 200)
+        session.refresh_from_db()
+        self.assertEqual((session.hits, session.combos), (10, 3))
+
+    def test_finish_ignores_client_duration(self) -> None:
+        started_at = timezone.now() - timezone.timedelta(seconds=29.5)
+        session = GameSession.objects.create(player=self.player, started_at=started_at)
+        payload = {'duration': 0, 'timeline': encode_timeline([500] * 3, [(0, 300)])}
+        response = self.client.post(
+            reverse('game:finish', args=[session.id]),
+            data=json.dumps(payload),
+            content_type='application/json',
+        )
+        self.assertEqual(response.status_code, 200)
+        session.refresh_from_db()
+        self.assertEqual(session.score, compute_score(1, 0, 0.0))
+
+    def test_finish_rejects_timeline_ahead_of_server_clock(self) -> None:
+        # a full round's timeline posted one second after the session started
+        started_at = timezone.now() - timezone.timedelta(seconds=1)
+        session = GameSession.objects.create(player=self.player, started_at=started_at)
+        payload = {'timeline': benchmarks.sample_timeline()}
+        response = self.client.post(
+            reverse('game:finish', args=[session.id]),
+            data=json.dumps(payload),
+            content_type='application/json',
+        )
+        self.assertEqual(response.status_code, 400)
+        session.refresh_from_db()
+        self.assertIsNone(session.ended_at)
+
+    def test_finish_keeps_round_with_implausible_hit(self) -> None:
+        started_at = timezone.now() - timezone.timedelta(seconds=30)
+        session = GameSession.objects.create(player=self.player, started_at=started_at)
+        payload = {'timeline': encode_timeline([500] * 3, [(0, 300), (1, 50), (2, 320)])}
+        response = self.client.post(
+            reverse('game:finish', args=[session.id]),
+            data=json.dumps(payload),
+            content_type='application/json',
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('redirect_url', response.json())
+        session.refresh_from_db()
+        self.assertIsNotNone(session.ended_at)
+        self.assertEqual(session.hits, 2)
+
+    def test_finish_rejects_missing_timeline(self) -> None:
+        session = GameSession.objects.create(player=self.player, started_at=timezone.now())
+        response = self.client.post(
+            reverse('game:finish', args=[session.id]),
+            data=json.dumps({'hits': 10, 'combos': 3, 'duration': 25}),
+            content_type='application/json',
+        )
+        self.assertEqual(response.status_code, 400)
+        session.refresh_from_db()
+        self.assertIsNone(session.ended_at)
+
     def test_leaderboard_view(self) -> None:
         # Create a finished session
         GameSession.objects.create(
@@ -66,4 +199,46 @@ class ViewTestCase(TestCase):
         )
         response = self.client.get(reverse('game:leaderboard'))
         self.assertEqual(response.status_code, 200)
-        self.assertContains(response, 'Top 10')
\ No newline at end of file
+        self.assertContains(response, 'Top 10')
+
+
+class WarmupTestCase(TestCase):
+    """Tests for the pre-fork warmup and the startup budget."""
+
+    def test_warmup_covers_templates_and_routes(self) -> None:
+        self.assertIn('game/play.html', warm_templates())
+        self.assertIn('finish', warm_urls())
+
+    @skipUnless(benchmarks.RUN_BENCHMARKS, 'set RUN_BENCHMARKS=1 to run wall-clock budgets')
+    def test_startup_within_budget(self) -> None:
+        startup = benchmarks.measure_startup()
+        self.assertLessEqual(startup['import'], benchmarks.IMPORT_BUDGET)
+        self.assertLessEqual(startup['first_request'], benchmarks.FIRST_REQUEST_BUDGET)
+
+
+class StaticPipelineTestCase(TestCase):
+    """Tests for the self-hosted, hashed and precompressed static assets."""
+
+    def test_base_template_has_no_cdn(self) -> None:
+        response = self.client.get(reverse('game:home'))
+        self.assertContains(response, 'game/tailwind.css')
+        self.assertNotContains(response, 'cdn.jsdelivr.net')
+
+    def test_collectstatic_hashes_compresses_and_caches(self) -> None:
+        with tempfile.TemporaryDirectory() as static_root, override_settings(
+            DEBUG=False,
+            STATIC_ROOT=static_root,
+            STORAGES={
+                'default': {'BACKEND': 'django.core.files.storage.FileSystemStorage'},
+                'staticfiles': {'BACKEND': 'whitenoise.storage.CompressedManifestStaticFilesStorage'},
+            },
+        ):
+            call_command('collectstatic', interactive=False, verbosity=0, ignore_patterns=['admin'])
+            hashed = staticfiles_storage.stored_name('game/tailwind.css')
+            self.assertRegex(hashed, r'^game/tailwind\.[0-9a-f]{12}\.css$')
+            for suffix in ('.gz', '.br'):
+                self.assertTrue((Path(static_root) / (hashed + suffix)).exists())
+            response = Client().get(staticfiles_storage.url('game/tailwind.css'), HTTP_ACCEPT_ENCODING='br')
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(response['Content-Encoding'], 'br')
+            self.assertIn('immutable', response['Cache-Control'])
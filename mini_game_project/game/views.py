@@ -20,8 +20,12 @@ from django.views.decorators.csrf import csrf_exempt
 
 from .forms import StartGameForm
 from .models import Player, GameSession
+from .timeline import TimelineError, verify_timeline
 from .utils import compute_score
 
+# Seconds a timeline may run ahead of the server's clock (clock skew, rounding).
+CLOCK_SLACK_SECONDS = 1.0
+
 
 def home(request: HttpRequest) -> HttpResponse:
     """Render the home page with a form to start a new game."""
@@ -65,11 +69,14 @@ def play(request: HttpRequest, session_id: int) -> HttpResponse:
 def finish(request: HttpRequest, session_id: int) -> JsonResponse:
     """Finish a game session by validating and persisting the score.
 
-    The client sends a JSON payload with ``hits``, ``combos``, and
-    ``duration`` (elapsed seconds). The server recalculates the score
-    deterministically and updates the ``GameSession``. If the session
-    has already been ended, no changes are made and a simple response
-    is returned.
+    The client sends a JSON payload with a base64 ``timeline`` of target
+    spawns and hits (see ``game.timeline``). Hits and combos are derived
+    from the verified timeline and the duration from the server's own
+    clock, so client-side totals are never trusted. A timeline longer than
+    the time elapsed since the session started is rejected. The score is
+    then recalculated deterministically and the ``GameSession`` updated.
+    If the session has already been ended, no changes are made and a
+    simple response is returned.
     """
     if request.method != 'POST':
         return HttpResponseBadRequest('Invalid method')  # type: ignore[return-value]
@@ -81,9 +88,17 @@ def finish(request: HttpRequest, session_id: int) -> JsonResponse:
         payload: Dict[str, Any] = json.loads(request.body.decode())
     except json.JSONDecodeError:
         return JsonResponse({'error': 'Invalid JSON'}, status=400)
-    hits = int(payload.get('hits', 0))
-    combos = int(payload.get('combos', 0))
-    duration = float(payload.get('duration', 0))
+    try:
+        verified = verify_timeline(payload.get('timeline', ''))
+    except TimelineError:
+        return JsonResponse({'error': 'Invalid timeline'}, status=400)
+    hits = verified.hits
+    combos = verified.combos
+    # measure elapsed time on the server; a timeline cannot describe more
+    # time than has passed since the session started
+    duration = (timezone.now() - session.started_at).total_seconds()
+    if verified.last_event_ms / 1000.0 > duration + CLOCK_SLACK_SECONDS:
+        return JsonResponse({'error': 'Invalid timeline'}, status=400)
     # compute remaining time; default game length is 30 seconds
     time_left = max(0.0, 30.0 - duration)
     score = compute_score(hits, combos, time_left)
@@ -0,0 +1,82 @@
+"""
+Pre-fork warmup for the game application.
+
+Cold workers pay for several lazy initialisations on their first requests:
+templates are compiled on first use, the URL resolver populates its reverse
+lookup tables on the first ``reverse()`` call, and the database is only
+touched when a view first queries it. ``warmup()`` performs all of that
+work up front so the WSGI/ASGI entry points can call it once in the master
+process before the server forks its workers, letting every worker inherit
+the warmed state.
+"""
+from __future__ import annotations
+
+import logging
+from pathlib import Path
+from typing import List
+
+from django.db import DatabaseError, connections
+from django.template.loader import get_template
+from django.urls import reverse
+
+from . import urls as game_urls
+from .models import GameSession
+
+logger = logging.getLogger(__name__)
+
+TEMPLATE_DIR = Path(__file__).resolve().parent / 'templates' / 'game'
+
+
+def warm_templates() -> List[str]:
+    """Load and compile every ``game/*.html`` template.
+
+    With the cached template loader the compiled templates stay in memory,
+    so subsequent ``render()`` calls skip parsing entirely.
+    """
+    names = [f'game/{path.name}' for path in sorted(TEMPLATE_DIR.glob('*.html'))]
+    for name in names:
+        get_template(name)
+    return names
+
+
+def warm_urls() -> List[str]:
+    """Reverse every named ``game`` route.
+
+    The first ``reverse()`` builds the resolver's lookup tables; routes
+    taking path converters are reversed with a placeholder argument so the
+    converter regexes are compiled as well.
+    """
+    names = []
+    for pattern in game_urls.urlpatterns:
+        if not pattern.name:
+            continue
+        args = [1] * len(pattern.pattern.converters)
+        reverse(f'{game_urls.app_name}:{pattern.name}', args=args)
+        names.append(pattern.name)
+    return names
+
+
+def warm_database() -> None:
+    """Open each database connection and prime it with the hot queries.
+
+    The leaderboard queries are evaluated once so the database's page cache
+    holds the score index. Connections are closed afterwards: a connection
+    opened before ``fork()`` must never be shared between worker processes,
+    and each worker reopens its own on first use.
+    """
+    try:
+        for alias in connections:
+            connections[alias].ensure_connection()
+        list(GameSession.objects.select_related('player').order_by('-score', 'ended_at')[:10])
+    except DatabaseError:
+        # A missing or unmigrated database should not stop the server booting
+        logger.warning('Database warmup skipped', exc_info=True)
+    finally:
+        connections.close_all()
+
+
+def warmup() -> None:
+    """Run every warmup step; intended to be called once before forking."""
+    warm_templates()
+    warm_urls()
+    warm_database()
@@ -9,4 +9,11 @@ from django.core.asgi import get_asgi_application  # type: ignore
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'mini_game_project.settings')
 
-application = get_asgi_application()
\ No newline at end of file
+application = get_asgi_application()
+
+# Compile templates, populate URL resolvers and prime the database before the
+# server forks its workers (e.g. ``gunicorn --preload``).
+if os.getenv('DJANGO_WARMUP', 'True') == 'True':
+    from game.warmup import warmup
+
+    warmup()
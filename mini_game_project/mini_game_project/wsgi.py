@@ -11,4 +11,11 @@ from django.core.wsgi import get_wsgi_application  # type: ignore
 # Set the default settings module for the 'django' program.
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'mini_game_project.settings')
 
-application = get_wsgi_application()
\ No newline at end of file
+application = get_wsgi_application()
+
+# Compile templates, populate URL resolvers and prime the database before the
+# server forks its workers (e.g. ``gunicorn --preload``).
+if os.getenv('DJANGO_WARMUP', 'True') == 'True':
+    from game.warmup import warmup
+
+    warmup()
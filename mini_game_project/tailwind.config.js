@@ -1,18 +1,19 @@
 /**
  * Tailwind CSS configuration.
  *
- * This config is provided for completeness. The project uses the Tailwind CDN in
- * templates for simplicity; however, if you wish to build a custom bundle,
- * uncomment the `content` paths and run the Tailwind CLI to generate a
- * production CSS file.
+ * `npm run build:css` scans the templates (and the form widgets, which set
+ * classes in Python) and writes a purged, minified bundle containing only
+ * the utilities in use to `game/static/game/tailwind.css`. Rebuild it after
+ * changing classes in any of the files listed under `content`.
  */
 module.exports = {
   content: [
     './game/templates/**/*.html',
     './templates/**/*.html',
+    './game/forms.py',
   ],
   theme: {
     extend: {},
   },
   plugins: [],
-}
\ No newline at end of file
+}